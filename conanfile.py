@@ -1,5 +1,48 @@
 from conan import ConanFile
 from conan.tools.cmake import CMakeToolchain, CMake, cmake_layout, CMakeDeps
+from conan.tools.scm import Version
+
+
+_BOOST_OPTS = {
+    'without_atomic': True,
+    'without_charconv': True,
+    'without_chrono': True,
+    'without_cobalt': True,
+    'without_container': True,
+    'without_context': True,
+    'without_contract': True,
+    'without_coroutine': True,
+    'without_date_time': True,
+    'without_exception': True,
+    'without_fiber': True,
+    'without_filesystem': True,
+    'without_graph': True,
+    'without_graph_parallel': True,
+    'without_iostreams': True,
+    'without_json': True,
+    'without_locale': True,
+    'without_log': True,
+    'without_math': True,
+    'without_mpi': True,
+    'without_nowide': True,
+    'without_process': True,
+    'without_program_options': False,
+    'without_python': True,
+    'without_random': True,
+    'without_regex': True,
+    'without_serialization': True,
+    'without_stacktrace': True,
+    'without_test': True,
+    'without_thread': True,
+    'without_timer': True,
+    'without_type_erasure': True,
+    'without_url': True,
+    'without_wave': True,
+}
+
+
+# One build tree serves every build type, each `conan install -s build_type=...` adds to it
+_CMAKE_GENERATOR = "Ninja Multi-Config"
 
 
 class hastenRecipe(ConanFile):
@@ -16,62 +59,42 @@ class hastenRecipe(ConanFile):
 
     # Binary configuration
     settings = "os", "compiler", "build_type", "arch"
+    options = {"slim_boost": [True, False]}
+    default_options = {"slim_boost": True}
 
     # Sources are located in the same place as this recipe, copy them to the recipe
     exports_sources = "CMakeLists.txt", "src/*"
 
     def requirements(self):
-        boost_opts = {
-            'without_atomic': True,
-            'without_charconv': True,
-            'without_chrono': True,
-            'without_cobalt': True,
-            'without_container': True,
-            'without_context': True,
-            'without_contract': True,
-            'without_coroutine': True,
-            'without_date_time': True,
-            'without_exception': True,
-            'without_fiber': True,
-            'without_filesystem': True,
-            'without_graph': True,
-            'without_graph_parallel': True,
-            'without_iostreams': True,
-            'without_json': True,
-            'without_locale': True,
-            'without_log': True,
-            'without_math': True,
-            'without_mpi': True,
-            'without_nowide': True,
-            'without_process': True,
-            'without_program_options': False,
-            'without_python': True,
-            'without_random': True,
-            'without_regex': True,
-            'without_serialization': True,
-            'without_stacktrace': True,
-            'without_test': True,
-            'without_thread': True,
-            'without_timer': True,
-            'without_type_erasure': True,
-            'without_url': True,
-            'without_wave': True,
-        }
-        self.requires("boost/1.89.0", options=boost_opts)
+        if self.options.slim_boost:
+            self.requires("boost/1.89.0", options=_BOOST_OPTS)
+        else:
+            self.requires("boost/1.89.0")
         self.requires("spdlog/1.16.0")
         self.requires("nlohmann_json/3.12.0")
         self.test_requires("gtest/1.17.0")
 
+    def build_requirements(self):
+        self.tool_requires("ninja/1.12.1")
+
+    @property
+    def _cmake_generator(self):
+        # layout() and generate() must agree, a generator set by the profile or CLI wins in both
+        return self.conf.get("tools.cmake.cmaketoolchain:generator", default=_CMAKE_GENERATOR)
+
     def layout(self):
-        cmake_layout(self)
+        cmake_layout(self, generator=self._cmake_generator)
 
     def generate(self):
         deps = CMakeDeps(self)
         deps.generate()
         tc = CMakeToolchain(self)
-        tc.preprocessor_definitions["HASTEN_VERSION_MAJOR"] = "2"
-        tc.preprocessor_definitions["HASTEN_VERSION_MINOR"] = "0"
-        tc.preprocessor_definitions["HASTEN_VERSION_PATCH"] = "0"
+        tc.generator = self._cmake_generator
+        tc.cache_variables["CMAKE_CONFIGURATION_TYPES"] = "Release;Debug;RelWithDebInfo"
+        version = Version(self.version)
+        for part, value in (("MAJOR", version.major), ("MINOR", version.minor), ("PATCH", version.patch)):
+            # Missing components (e.g. "2.1") are None, prerelease suffixes are not part of .patch
+            tc.preprocessor_definitions[f"HASTEN_VERSION_{part}"] = str(value or 0)
         tc.generate()
 
     def build(self):
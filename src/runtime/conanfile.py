@@ -1,20 +1,38 @@
+import os
+
 from conan import ConanFile
+from conan.errors import ConanException
+from conan.tools.files import copy
 from conan.tools.cmake import CMakeToolchain, CMake, cmake_layout, CMakeDeps
 
 class HastenRuntimeConan(ConanFile):
     name = "hasten_runtime"
     version = "2.0.0"
+    package_type = "static-library"
     license = "Apache-2.0"
     description = "Runtime support library for Hasten-generated C++ bindings."
     url = "https://github.com/oleh-synelnykov/hasten"
     settings = "os", "compiler", "build_type", "arch"
+    build_policy = "missing"
     exports_sources = "CMakeLists.txt", "include/*", "*.cpp"
 
+    @property
+    def _repository_root(self):
+        # The license lives at the repository root, outside of this recipe's folder
+        return os.path.join(self.recipe_folder, "..", "..")
+
+    def export_sources(self):
+        copy(self, "LICENSE", self._repository_root, self.export_sources_folder)
+
+    def build_requirements(self):
+        self.tool_requires("ninja/1.12.1")
+
     def layout(self):
         cmake_layout(self)
 
     def generate(self):
         tc = CMakeToolchain(self)
+        tc.generator = "Ninja"
         tc.generate()
         deps = CMakeDeps(self)
         deps.generate()
@@ -27,6 +45,16 @@ class HastenRuntimeConan(ConanFile):
     def package(self):
         cmake = CMake(self)
         cmake.install()
+        licenses_dir = os.path.join(self.package_folder, "licenses")
+        copied = copy(self, "LICENSE", self.source_folder, licenses_dir)
+        if not copied:
+            # Local `conan build` / `conan export-pkg` use src/runtime as the source folder, which has no LICENSE
+            copied = copy(self, "LICENSE", self._repository_root, licenses_dir)
+        if not copied:
+            raise ConanException("LICENSE not found, the package would ship without a license")
 
     def package_info(self):
-        self.cpp_info.libs = ["hasten_runtime"]
+        # Generated bindings link against hasten_runtime::hasten_runtime, which aggregates the components
+        self.cpp_info.components["core"].libs = ["hasten_runtime"]
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            self.cpp_info.components["core"].system_libs = ["pthread"]